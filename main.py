@@ -1,9 +1,49 @@
+import bisect
+import functools
 import math
+import operator
+import time
 import tkinter as tk
+from collections import namedtuple
+from contextlib import contextmanager, nullcontext
 from tkinter import scrolledtext, ttk
 
+from simulator.models import STATE_NAMES
 from simulator.os_simulator import OSSimulator
 
+_MemGeom = namedtuple("_MemGeom", "frame_count cols rows cell_w cell_h pad coords centers")
+
+Q_LABELS = tuple(f"Q{i}" for i in range(8))
+_PROC_FIELDS = operator.attrgetter(
+    "pid", "name", "state", "remaining_actions", "current_quantum", "queue_level"
+)
+_Q_TAGS = tuple((f"q{i}",) for i in range(8))
+
+
+@functools.lru_cache(maxsize=256)
+def _proc_label(pid: int, name: str) -> str:
+    return f"{pid}-{name}"
+
+
+@functools.lru_cache(maxsize=512)
+def _queue_label(pid: int, quantum: int) -> str:
+    return f"P{pid}({quantum})"
+
+_PID_PALETTE = (
+    "#c7e9c0",
+    "#a1d99b",
+    "#74c476",
+    "#31a354",
+    "#add8e6",
+    "#9ecae1",
+    "#6baed6",
+    "#4292c6",
+    "#fdd0a2",
+    "#fdae6b",
+    "#fd8d3c",
+    "#e6550d",
+)
+
 
 class SimulatorGUI:
     def __init__(self, root: tk.Tk):
@@ -13,8 +53,24 @@ class SimulatorGUI:
         self.simulator.reset()
         self.auto_running = False
         self.selected_pid: int | None = None
-        self.last_log_len = 0
-        self._color_cache: dict[int, str] = {}
+        self._muting_selection = False
+        self._proc_row_cache: dict[int, tuple] = {}
+        self._proc_order: list[int] = []
+        self._queue_cache: list[list[str]] = [[], [], []]
+        self._file_row_cache: dict[str, tuple] = {}
+        self._last_files_version = -1
+        self._mem_items: list[dict] = []
+        self._mem_geom: _MemGeom | None = None
+        self._free_set: set[int] = set()
+        self._free_order: list[int] = []
+        self._pt_sig: tuple | None = None
+        self._pt_rows: list[tuple] = []
+        self._buf_items: list[dict] = []
+        self._buf_arrows: dict[str, dict] = {}
+        self._render_pending = False
+        self._last_render_sig: tuple | None = None
+        self._last_state_sig: tuple | None = None
+        self._after_id: str | None = None
 
         self._build_layout()
         self._render_snapshot()
@@ -54,6 +110,13 @@ class SimulatorGUI:
         self.process_tree.column("remain", width=80)
         self.process_tree.column("quantum", width=80)
         self.process_tree.column("queue", width=60)
+        # Row styling is registered once; inserts then only attach a tag and
+        # Tk applies the colors without any per-row configure calls.
+        for level in range(3):
+            self.process_tree.tag_configure(f"q{level}", background=_PID_PALETTE[level])
+        self.process_tree.tag_configure("running", background="#fdd0a2")
+        self.process_tree.tag_configure("blocked", background="#f1c4c4")
+        self.process_tree.tag_configure("finished", background="#e0e0e0")
         ttk.Label(left, text="进程管理 / 调度").pack(anchor=tk.W)
         self.process_tree.pack(fill=tk.BOTH, expand=True)
         self.process_tree.bind("<<TreeviewSelect>>", self._on_select_process)
@@ -119,234 +182,421 @@ class SimulatorGUI:
         self.log_area = scrolledtext.ScrolledText(right, height=18, state=tk.DISABLED)
         self.log_area.pack(fill=tk.BOTH, expand=True)
 
+    @contextmanager
+    def _bulk_update(self, tree: ttk.Treeview):
+        """Hide the columns while many rows change so Tk lays out only once."""
+        tree.configure(displaycolumns=())
+        try:
+            yield
+        finally:
+            tree.configure(displaycolumns="#all")
+
     def _clear_tree(self, tree: ttk.Treeview) -> None:
-        for item in tree.get_children():
-            tree.delete(item)
+        children = tree.get_children()
+        if children:
+            tree.delete(*children)
 
     def _color_for_pid(self, pid: int) -> str:
-        if pid not in self._color_cache:
-            palette = [
-                "#c7e9c0",
-                "#a1d99b",
-                "#74c476",
-                "#31a354",
-                "#add8e6",
-                "#9ecae1",
-                "#6baed6",
-                "#4292c6",
-                "#fdd0a2",
-                "#fdae6b",
-                "#fd8d3c",
-                "#e6550d",
-            ]
-            self._color_cache[pid] = palette[len(self._color_cache) % len(palette)]
-        return self._color_cache[pid]
-
-    def _render_processes(self, snapshot: dict) -> None:
-        self._clear_tree(self.process_tree)
-        rows = []
-        if snapshot["running"]:
-            proc = snapshot["running"]
+        return _PID_PALETTE[pid % len(_PID_PALETTE)]
+
+    def _render_processes(self) -> None:
+        sim = self.simulator
+        rows: list[tuple[int, tuple, tuple]] = []
+        fields = _PROC_FIELDS
+        if sim.running:
+            pid, name, state, remain, quantum, level = fields(sim.running)
             rows.append(
                 (
-                    f"{proc.pid}-{proc.name}",
-                    proc.state,
-                    proc.remaining_actions,
-                    proc.current_quantum,
-                    f"Q{proc.queue_level}",
+                    pid,
+                    (_proc_label(pid, name), STATE_NAMES[state], remain, quantum, Q_LABELS[level]),
+                    ("running",),
                 )
             )
-        for level, queue in enumerate(snapshot["ready"]):
+        for level, queue in enumerate(sim.ready_queues):
+            label = Q_LABELS[level]
+            tags = _Q_TAGS[level]
             for proc in queue:
+                pid, name, state, remain, quantum, _ = fields(proc)
                 rows.append(
-                    (
-                        f"{proc.pid}-{proc.name}",
-                        proc.state,
-                        proc.remaining_actions,
-                        proc.current_quantum,
-                        f"Q{level}",
-                    )
+                    (pid, (_proc_label(pid, name), STATE_NAMES[state], remain, quantum, label), tags)
                 )
-        for proc in snapshot["blocked"]:
-            detail = proc.wait_reason or f"阻塞({proc.io_timer})"
+        for proc in sim.blocked:
+            pid, name, state, remain, quantum, level = fields(proc)
+            detail = proc.wait_label() or f"阻塞({proc.io_timer})"
             rows.append(
                 (
-                    f"{proc.pid}-{proc.name}",
-                    detail,
-                    proc.remaining_actions,
-                    proc.current_quantum,
-                    f"Q{proc.queue_level}",
+                    pid,
+                    (_proc_label(pid, name), detail, remain, quantum, Q_LABELS[level]),
+                    ("blocked",),
                 )
             )
-        for proc in snapshot["finished"]:
+        for proc in sim.finished:
+            pid, name, state, remain, quantum, level = fields(proc)
             rows.append(
                 (
-                    f"{proc.pid}-{proc.name}",
-                    proc.state,
-                    proc.remaining_actions,
-                    proc.current_quantum,
-                    f"Q{proc.queue_level}",
+                    pid,
+                    (_proc_label(pid, name), STATE_NAMES[state], remain, quantum, Q_LABELS[level]),
+                    ("finished",),
                 )
             )
 
-        for name, state, remain, quantum, level in rows:
-            self.process_tree.insert("", tk.END, values=(name, state, remain, quantum, level))
-
-    def _render_queues(self, snapshot: dict) -> None:
+        # Diff against the previous render so only changed rows hit Tk.
+        tree = self.process_tree
+        cache = self._proc_row_cache
+        seen = {row[0] for row in rows}
+        # Deleting a selected row fires <<TreeviewSelect>>; mute the handler
+        # while rows come and go so it only sees real user clicks. A flag is
+        # used rather than rebinding, since each bind() registers a fresh
+        # Tcl command that Tk never frees.
+        self._muting_selection = seen != cache.keys()
+        try:
+            for index, (pid, values, tags) in enumerate(rows):
+                iid = f"p{pid}"
+                cached = cache.get(pid)
+                if cached is None:
+                    tree.insert("", index, iid=iid, values=values, tags=tags)
+                elif cached != (values, tags):
+                    tree.item(iid, values=values, tags=tags)
+                cache[pid] = (values, tags)
+            for pid in [pid for pid in cache if pid not in seen]:
+                tree.delete(f"p{pid}")
+                del cache[pid]
+            order = [row[0] for row in rows]
+            if order != self._proc_order:
+                for index, pid in enumerate(order):
+                    tree.move(f"p{pid}", "", index)
+                self._proc_order = order
+        finally:
+            self._muting_selection = False
+
+    def _render_queues(self) -> None:
+        queues = self.simulator.ready_queues
         for idx, box in enumerate(self.queue_boxes):
-            box.delete(0, tk.END)
-            for proc in snapshot["ready"][idx]:
-                box.insert(tk.END, f"P{proc.pid}({proc.current_quantum})")
-
-    def _render_memory(self, snapshot: dict) -> None:
-        frames = snapshot["frames"]
-        used = len([f for f in frames if f is not None])
-        free = len(frames) - used
-        self.memory_info.configure(text=f"物理帧: {len(frames)} 已用: {used} 空闲: {free}")
-
-        # Draw memory grid similar to textbook paging diagrams.
-        self.memory_canvas.delete("all")
-        cols = max(4, math.ceil(math.sqrt(len(frames))))
-        cell_w, cell_h = 90, 42
-        pad = 6
+            desired = [
+                _queue_label(proc.pid, proc.current_quantum)
+                for proc in queues[idx]
+            ]
+            current = self._queue_cache[idx]
+            if desired == current:
+                continue
+            # Keep the unchanged prefix and rewrite only the tail in one
+            # delete plus one bulk insert.
+            prefix = 0
+            for prefix, (new, old) in enumerate(zip(desired, current)):
+                if new != old:
+                    break
+            else:
+                prefix = min(len(desired), len(current))
+            box.delete(prefix, tk.END)
+            if desired[prefix:]:
+                box.insert(tk.END, *desired[prefix:])
+            self._queue_cache[idx] = desired
+
+    def _render_memory(self) -> None:
+        frames = self.simulator.memory.frame_table
+        canvas = self.memory_canvas
+        if self._mem_geom is None or self._mem_geom.frame_count != len(frames):
+            self._build_memory_grid(len(frames))
+
+        # Keep one rectangle/label pair per frame and only reconfigure cells
+        # whose content or highlight changed since the previous render. The
+        # same pass collects the free frames so the list is walked only once.
+        last_access = self.simulator.memory.last_access
+        free_indices: list[int] = []
         for idx, cell in enumerate(frames):
+            if cell is None:
+                free_indices.append(idx)
+            item = self._mem_items[idx]
+            if cell != item["last_cell"]:
+                fill = "#f1f1f1" if cell is None else self._color_for_pid(cell[0])
+                label = "空闲" if cell is None else f"P{cell[0]}.{cell[1]}"
+                canvas.itemconfigure(item["rect"], fill=fill)
+                canvas.itemconfigure(item["label"], text=label)
+                item["last_cell"] = cell
+            highlighted = last_access == idx
+            if highlighted != item["last_hl"]:
+                canvas.itemconfigure(item["rect"], width=3 if highlighted else 1)
+                item["last_hl"] = highlighted
+
+        used = len(frames) - len(free_indices)
+        self.memory_info.configure(
+            text=f"物理帧: {len(frames)} 已用: {used} 空闲: {len(free_indices)}"
+        )
+        self._update_free_list(free_indices)
+
+        self._render_page_table()
+
+    def _update_free_list(self, free_indices: list[int]) -> None:
+        new_free = set(free_indices)
+        if new_free == self._free_set:
+            return
+        for idx in sorted(self._free_set - new_free, reverse=True):
+            pos = bisect.bisect_left(self._free_order, idx)
+            self.free_list.delete(pos)
+            del self._free_order[pos]
+        for idx in sorted(new_free - self._free_set):
+            pos = bisect.bisect_left(self._free_order, idx)
+            self.free_list.insert(pos, idx)
+            self._free_order.insert(pos, idx)
+        self._free_set = new_free
+
+    def _build_memory_grid(self, frame_count: int) -> None:
+        # Draw memory grid similar to textbook paging diagrams. Geometry only
+        # depends on the frame count, so compute it once and cache it.
+        cols = max(4, math.ceil(math.sqrt(frame_count)))
+        rows = math.ceil(frame_count / cols)
+        cell_w, cell_h, pad = 90, 42, 6
+        coords = []
+        centers = []
+        for idx in range(frame_count):
             row, col = divmod(idx, cols)
             x1, y1 = col * (cell_w + pad), row * (cell_h + pad)
-            x2, y2 = x1 + cell_w, y1 + cell_h
-            fill = "#f1f1f1" if cell is None else self._color_for_pid(cell[0])
-            outline_width = 3 if snapshot["last_access"] == idx else 1
-            self.memory_canvas.create_rectangle(x1, y1, x2, y2, fill=fill, outline="#555", width=outline_width)
-            label = "空闲" if cell is None else f"P{cell[0]}.{cell[1]}"
-            self.memory_canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=label)
-            self.memory_canvas.create_text(x1 + 14, y1 + 12, text=str(idx), font=("TkDefaultFont", 8), fill="#333")
-
-        total_rows = math.ceil(len(frames) / cols)
-        self.memory_canvas.configure(scrollregion=(0, 0, cols * (cell_w + pad), total_rows * (cell_h + pad)))
-
-        self.free_list.delete(0, tk.END)
-        for idx, cell in enumerate(frames):
-            if cell is None:
-                self.free_list.insert(tk.END, idx)
-
-        self._render_page_table(snapshot)
-
-    def _render_files(self, snapshot: dict) -> None:
-        self._clear_tree(self.file_tree)
-        for path, entry in snapshot["files"].items():
-            self.file_tree.insert("", tk.END, text=path, values=(entry.owner, entry.size))
-
-    def _render_buffer(self, snapshot: dict) -> None:
-        buf = snapshot["buffer"]
-        capacity = buf["capacity"]
-        slots = buf["slots"]
-        used = buf["used"]
-        in_ptr = buf["in"]
-        out_ptr = buf["out"]
+            coords.append((x1, y1, x1 + cell_w, y1 + cell_h))
+            centers.append(((x1 + x1 + cell_w) / 2, (y1 + y1 + cell_h) / 2))
+        self._mem_geom = _MemGeom(frame_count, cols, rows, cell_w, cell_h, pad, coords, centers)
+
+        canvas = self.memory_canvas
+        canvas.delete("all")
+        self._mem_items = []
+        for idx in range(frame_count):
+            x1, y1, x2, y2 = coords[idx]
+            rect = canvas.create_rectangle(x1, y1, x2, y2, fill="#f1f1f1", outline="#555", width=1)
+            label = canvas.create_text(*centers[idx], text="空闲")
+            canvas.create_text(x1 + 14, y1 + 12, text=str(idx), font=("TkDefaultFont", 8), fill="#333")
+            self._mem_items.append({"rect": rect, "label": label, "last_cell": None, "last_hl": False})
+
+        canvas.configure(scrollregion=(0, 0, cols * (cell_w + pad), rows * (cell_h + pad)))
+
+    def _render_files(self) -> None:
+        fs = self.simulator.file_system
+        if fs.version == self._last_files_version:
+            return
+        self._last_files_version = fs.version
+        tree = self.file_tree
+        cache = self._file_row_cache
+        seen = set()
+        for path, entry in fs.files.items():
+            values = (entry.owner, entry.size)
+            seen.add(path)
+            cached = cache.get(path)
+            if cached is None:
+                tree.insert("", tk.END, iid=path, text=path, values=values)
+            elif cached != values:
+                tree.item(path, values=values)
+            cache[path] = values
+        for path in [path for path in cache if path not in seen]:
+            tree.delete(path)
+            del cache[path]
+
+    _BUF_MARGIN = 20
+    _BUF_CELL_W = 70
+    _BUF_CELL_H = 40
+    _BUF_GAP = 6
+
+    def _render_buffer(self) -> None:
+        sim = self.simulator
+        capacity = sim.buffer_capacity
+        slots = sim.buffer_slots
+        used = sim.buffer_count
         self.buffer_status.configure(text=f"缓冲区: {used}/{capacity}")
 
-        self.buffer_canvas.delete("all")
-        margin = 20
-        cell_w = 70
-        cell_h = 40
-        gap = 6
+        canvas = self.buffer_canvas
+        if len(self._buf_items) != capacity:
+            self._build_buffer_slots(capacity)
         for idx in range(capacity):
-            x1 = margin + idx * (cell_w + gap)
-            y1 = 20
-            x2 = x1 + cell_w
-            y2 = y1 + cell_h
+            item = self._buf_items[idx]
             owner = slots[idx]
-            fill = "#fff" if owner is None else self._color_for_pid(owner)
-            self.buffer_canvas.create_rectangle(
-                x1, y1, x2, y2, fill=fill, outline="#555", width=2
-            )
-            label = f"P{owner}" if owner is not None else ""
-            self.buffer_canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text=label)
-            self.buffer_canvas.create_text((x1 + x2) / 2, y1 - 10, text=str(idx))
-
-        def draw_arrow(position: int, color: str, text: str, dy: int) -> None:
-            x1 = margin + position * (cell_w + gap)
-            x2 = x1 + cell_w
-            mid_x = (x1 + x2) / 2
-            base_y = 20 + cell_h + dy
-            self.buffer_canvas.create_line(mid_x, base_y, mid_x, base_y - dy + 6, arrow=tk.LAST, fill=color, width=2)
-            self.buffer_canvas.create_text(mid_x, base_y + (8 if dy > 0 else -12), text=text, fill=color)
-
-        draw_arrow(in_ptr, "#d62728", "in", -20)
-        draw_arrow(out_ptr, "#1f77b4", "out", 34)
-
-    def _render_logs(self, snapshot: dict) -> None:
+            if owner == item["last_owner"]:
+                continue
+            fill = "#fff" if owner < 0 else self._color_for_pid(owner)
+            canvas.itemconfigure(item["rect"], fill=fill)
+            canvas.itemconfigure(item["label"], text=f"P{owner}" if owner >= 0 else "")
+            item["last_owner"] = owner
+
+        self._move_buffer_arrow("in", sim.buffer_in)
+        self._move_buffer_arrow("out", sim.buffer_out)
+
+    def _build_buffer_slots(self, capacity: int) -> None:
+        canvas = self.buffer_canvas
+        canvas.delete("all")
+        self._buf_items = []
+        for idx in range(capacity):
+            x1 = self._BUF_MARGIN + idx * (self._BUF_CELL_W + self._BUF_GAP)
+            y1 = 20
+            x2 = x1 + self._BUF_CELL_W
+            y2 = y1 + self._BUF_CELL_H
+            rect = canvas.create_rectangle(x1, y1, x2, y2, fill="#fff", outline="#555", width=2)
+            label = canvas.create_text((x1 + x2) / 2, (y1 + y2) / 2, text="")
+            canvas.create_text((x1 + x2) / 2, y1 - 10, text=str(idx))
+            self._buf_items.append({"rect": rect, "label": label, "last_owner": None})
+        self._buf_arrows = {
+            "in": self._build_buffer_arrow("#d62728", "in", -20),
+            "out": self._build_buffer_arrow("#1f77b4", "out", 34),
+        }
+
+    def _build_buffer_arrow(self, color: str, text: str, dy: int) -> dict:
+        canvas = self.buffer_canvas
+        base_y = 20 + self._BUF_CELL_H + dy
+        line = canvas.create_line(0, base_y, 0, base_y - dy + 6, arrow=tk.LAST, fill=color, width=2)
+        label = canvas.create_text(0, base_y + (8 if dy > 0 else -12), text=text, fill=color)
+        return {"line": line, "label": label, "dy": dy, "pos": None}
+
+    def _move_buffer_arrow(self, name: str, position: int) -> None:
+        arrow = self._buf_arrows[name]
+        if arrow["pos"] == position:
+            return
+        canvas = self.buffer_canvas
+        dy = arrow["dy"]
+        mid_x = self._BUF_MARGIN + position * (self._BUF_CELL_W + self._BUF_GAP) + self._BUF_CELL_W / 2
+        base_y = 20 + self._BUF_CELL_H + dy
+        canvas.coords(arrow["line"], mid_x, base_y, mid_x, base_y - dy + 6)
+        canvas.coords(arrow["label"], mid_x, base_y + (8 if dy > 0 else -12))
+        arrow["pos"] = position
+
+    _LOG_MAX_LINES = 2000
+    _LOG_TRIM_LINES = 500
+
+    def _render_logs(self) -> None:
+        new = self.simulator.drain_log()
+        if not new:
+            return
+        # Only autoscroll when the user was already at the bottom, so reading
+        # back through the history is not interrupted by new entries.
+        at_bottom = self.log_area.yview()[1] >= 0.999
         self.log_area.configure(state=tk.NORMAL)
-        for line in snapshot["log"][self.last_log_len :]:
-            self.log_area.insert(tk.END, line + "\n")
-        self.last_log_len = len(snapshot["log"])
+        self.log_area.insert(tk.END, "\n".join(new) + "\n")
+        # Bound the widget so an all-day run cannot grow it without limit.
+        line_count = int(self.log_area.index("end-1c").split(".")[0])
+        if line_count > self._LOG_MAX_LINES:
+            self.log_area.delete("1.0", f"{self._LOG_TRIM_LINES}.0")
         self.log_area.configure(state=tk.DISABLED)
-        self.log_area.yview_moveto(1.0)
-
-    def _render_page_table(self, snapshot: dict) -> None:
-        self._clear_tree(self.page_table_tree)
+        if at_bottom:
+            # see() is a no-op when the end is already visible, unlike
+            # yview_moveto which always forces a geometry pass.
+            self.log_area.see(tk.END)
+
+    def _render_page_table(self) -> None:
+        tree = self.page_table_tree
+        cache = self._pt_rows
         pid = self.selected_pid
-        if pid is None and snapshot["running"]:
-            pid = snapshot["running"].pid
+        if pid is None and self.simulator.running:
+            pid = self.simulator.running.pid
         if pid is None:
+            if cache:
+                self._clear_tree(tree)
+                cache.clear()
+            self._pt_sig = None
             return
-        table = snapshot["page_tables"].get(pid, {})
-        meta = snapshot.get("process_meta", {}).get(pid)
-        total_pages = meta.get("memory_pages") if meta else None
-        pages = range(total_pages) if total_pages is not None else sorted(table.keys())
-        for page in pages:
-            frame = table.get(page)
-            status = "驻留" if frame is not None else "未装入"
-            frame_text = frame if frame is not None else "-"
-            self.page_table_tree.insert("", tk.END, values=(page, frame_text, status))
+        proc = self.simulator.process_pool.get(pid)
+        table = proc.page_table if proc else []
+        # Re-touching the tree is only needed when the displayed table changed.
+        sig = (pid, tuple(table))
+        if sig == self._pt_sig:
+            return
+        self._pt_sig = sig
+        # Page rows are keyed by page number, so switching process or updating
+        # a frame only rewrites the rows that differ.
+        resize = len(cache) != len(table)
+        with self._bulk_update(tree) if resize else nullcontext():
+            for page, frame in enumerate(table):
+                status = "驻留" if frame >= 0 else "未装入"
+                values = (page, frame if frame >= 0 else "-", status)
+                if page < len(cache):
+                    if cache[page] != values:
+                        tree.item(f"pg{page}", values=values)
+                        cache[page] = values
+                else:
+                    tree.insert("", tk.END, iid=f"pg{page}", values=values)
+                    cache.append(values)
+            while len(cache) > len(table):
+                tree.delete(f"pg{len(cache) - 1}")
+                cache.pop()
 
     def _render_snapshot(self) -> None:
-        snapshot = self.simulator.snapshot()
-        self.clock_label.configure(text=f"时钟: {snapshot['clock']}")
-        self._render_processes(snapshot)
-        self._render_queues(snapshot)
-        self._render_memory(snapshot)
-        self._render_files(snapshot)
-        self._render_buffer(snapshot)
-        self._render_logs(snapshot)
+        # Render straight off the simulator's attributes: the GUI and the
+        # simulator share one thread, so the snapshot() dict is kept only
+        # for external callers. Skip the whole render when nothing the
+        # panels depend on has moved since the previous paint.
+        sim = self.simulator
+        sig = (sim.version, self.selected_pid)
+        if sig == self._last_render_sig:
+            return
+        self._last_render_sig = sig
+        self.clock_label.configure(text=f"时钟: {sim.clock}")
+        # Idle ticks only advance the clock and append a log line; the heavy
+        # panels are repainted solely when scheduler/memory state mutated.
+        state_sig = (sim.state_version, self.selected_pid)
+        if state_sig != self._last_state_sig:
+            self._last_state_sig = state_sig
+            self._render_processes()
+            self._render_queues()
+            self._render_memory()
+            self._render_files()
+            self._render_buffer()
+        self._render_logs()
+
+    def _schedule_render(self) -> None:
+        if self._render_pending:
+            return
+        self._render_pending = True
+        self.root.after_idle(self._flush_render)
+
+    def _flush_render(self) -> None:
+        self._render_pending = False
+        self._render_snapshot()
 
     def _run_loop(self) -> None:
         if not self.auto_running:
             return
+        started = time.perf_counter()
+        before = self.simulator.state_version
         self._on_step()
-        self.root.after(800, self._run_loop)
+        # Aim for a steady cadence: subtract the time the step itself took.
+        # Ticks that changed no scheduler/memory state (idle processor) get
+        # a longer delay so an idling sim wakes the event loop less often.
+        idle = self.simulator.state_version == before
+        elapsed_ms = int((time.perf_counter() - started) * 1000)
+        delay = 1500 if idle else 800
+        self._after_id = self.root.after(max(1, delay - elapsed_ms), self._run_loop)
+
+    def _cancel_run_loop(self) -> None:
+        if self._after_id is not None:
+            self.root.after_cancel(self._after_id)
+            self._after_id = None
 
     def _on_step(self) -> None:
         self.simulator.step()
-        self._render_snapshot()
+        self._schedule_render()
 
     def _toggle_auto(self) -> None:
         self.auto_running = not self.auto_running
         self.auto_btn.configure(text="暂停" if self.auto_running else "自动运行")
         if self.auto_running:
             self._run_loop()
+        else:
+            self._cancel_run_loop()
 
     def _on_reset(self) -> None:
         self.simulator.reset()
         self.auto_running = False
+        self._cancel_run_loop()
         self.auto_btn.configure(text="自动运行")
         self.selected_pid = None
-        self.last_log_len = 0
-        self._render_snapshot()
+        self._last_render_sig = None
+        self._last_state_sig = None
+        self._last_files_version = -1
+        self._schedule_render()
 
     def _on_select_process(self, event: tk.Event) -> None:
+        if self._muting_selection:
+            return
         selection = self.process_tree.selection()
         if not selection:
             return
-        item = selection[0]
-        values = self.process_tree.item(item, "values")
-        if not values:
-            return
-        name = values[0]
-        try:
-            self.selected_pid = int(name.split("-")[0])
-        except ValueError:
-            self.selected_pid = None
-        self._render_snapshot()
+        # Row iids are always "p<pid>", so the pid comes straight from the
+        # iid without a values round-trip or string parsing fallbacks.
+        self.selected_pid = int(selection[0][1:])
+        self._schedule_render()
 
 
 def main() -> None:
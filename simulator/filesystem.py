@@ -6,7 +6,6 @@ from typing import Dict, Optional
 class FileEntry:
     owner: int
     size: int
-    content: str
 
 
 class FileSystem:
@@ -14,20 +13,25 @@ class FileSystem:
 
     def __init__(self):
         self.files: Dict[str, FileEntry] = {}
+        # Bumped on every mutation so the GUI can skip re-rendering the
+        # file table when nothing changed.
+        self.version = 0
 
     def create(self, path: str, owner: int, size: int = 0) -> str:
         if path in self.files:
             return f"文件 {path} 已存在，覆盖旧数据。"
-        self.files[path] = FileEntry(owner=owner, size=size, content="" * size)
+        self.files[path] = FileEntry(owner=owner, size=size)
+        self.version += 1
         return f"进程 {owner} 创建文件 {path}，初始大小 {size}KB。"
 
     def write(self, path: str, owner: int, size: int) -> str:
         entry = self.files.get(path)
         if not entry:
-            self.files[path] = FileEntry(owner=owner, size=size, content="" * size)
+            self.files[path] = FileEntry(owner=owner, size=size)
+            self.version += 1
             return f"进程 {owner} 向新文件 {path} 写入 {size}KB。"
         entry.size += size
-        entry.content += "#" * size
+        self.version += 1
         return f"进程 {owner} 扩展文件 {path}，增加 {size}KB。"
 
     def read(self, path: str, owner: int) -> str:
@@ -40,7 +44,9 @@ class FileSystem:
         if path not in self.files:
             return f"进程 {owner} 删除 {path} 失败：文件不存在。"
         del self.files[path]
+        self.version += 1
         return f"进程 {owner} 删除文件 {path}。"
 
     def reset(self) -> None:
         self.files.clear()
+        self.version += 1
@@ -1,4 +1,3 @@
-from collections import deque
 from typing import Dict, List, Optional, Tuple
 
 from .models import Process
@@ -10,8 +9,15 @@ class MemoryManager:
     def __init__(self, frames: int = 20):
         self.frames = frames
         self.frame_table: List[Optional[Tuple[int, int]]] = [None for _ in range(frames)]
-        self.replacement_queue: deque[int] = deque(range(frames))
-        self.page_locations: Dict[Tuple[int, int], int] = {}
+        # FIFO replacement is round-robin over all frames, so a single
+        # cursor replaces the old deque of frame numbers.
+        self._fifo_cursor = 0
+        # Nested {pid: {page: frame}} so the hot lookup needs no (pid, page)
+        # tuple allocation or tuple hashing. A plain dict, and outer entries
+        # are dropped as soon as a pid's last resident page is evicted, so
+        # the table stays bounded by the frame count rather than growing
+        # with every pid the simulation has ever seen.
+        self.page_locations: Dict[int, Dict[int, int]] = {}
         self.last_access: Optional[int] = None
 
     def access_page(self, process: Process, page: int) -> Tuple[bool, int, Optional[Tuple[int, int]]]:
@@ -20,25 +26,30 @@ class MemoryManager:
         evicted_page is (pid, page) when a page is replaced.
         """
         normalized = page % max(process.memory_pages, 1)
-        key = (process.pid, normalized)
-        if key in self.page_locations:
-            frame = self.page_locations[key]
-            self.last_access = frame
-            return False, frame, None
+        pages = self.page_locations.get(process.pid)
+        if pages is not None:
+            frame = pages.get(normalized)
+            if frame is not None:
+                self.last_access = frame
+                return False, frame, None
 
-        frame = self.replacement_queue.popleft()
+        frame = self._fifo_cursor
+        self._fifo_cursor = (frame + 1) % self.frames
         evicted: Optional[Tuple[int, int]] = self.frame_table[frame]
-        if evicted and evicted in self.page_locations:
-            del self.page_locations[evicted]
-        self.frame_table[frame] = key
-        self.page_locations[key] = frame
-        self.replacement_queue.append(frame)
+        if evicted:
+            evicted_pages = self.page_locations.get(evicted[0])
+            if evicted_pages is not None:
+                evicted_pages.pop(evicted[1], None)
+                if not evicted_pages:
+                    del self.page_locations[evicted[0]]
+        self.frame_table[frame] = (process.pid, normalized)
+        self.page_locations.setdefault(process.pid, {})[normalized] = frame
         self.last_access = frame
         process.page_table[normalized] = frame
         return True, frame, evicted
 
     def reset(self) -> None:
         self.frame_table = [None for _ in range(self.frames)]
-        self.replacement_queue = deque(range(self.frames))
+        self._fifo_cursor = 0
         self.page_locations.clear()
         self.last_access = None
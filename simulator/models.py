@@ -1,10 +1,24 @@
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
+# Process states as small ints so the scheduler's hot comparisons are a
+# single integer compare; STATE_NAMES maps back to display text.
+STATE_NEW, STATE_READY, STATE_RUNNING, STATE_BLOCKED, STATE_FINISHED = range(5)
+STATE_NAMES = ("New", "Ready", "Running", "Blocked", "Finished")
 
-@dataclass
+# Wait conditions a blocked process can sit on; WAIT_RES carries the
+# resource name in Process.wait_resource.
+WAIT_NONE, WAIT_SLOT, WAIT_ITEM, WAIT_MUTEX, WAIT_RES = range(5)
+_WAIT_LABELS = ("", "等待空槽", "等待产品", "等待互斥锁", "等待资源")
+
+
+@dataclass(frozen=True, slots=True)
 class ProcessAction:
-    """A single step a process can perform in the simulation."""
+    """A single step a process can perform in the simulation.
+
+    Frozen so action scripts can be shared freely between templates,
+    clones, and dynamically spawned jobs without defensive copies.
+    """
 
     kind: str
     description: str
@@ -15,60 +29,97 @@ class ProcessAction:
     resource: Optional[str] = None
 
 
-@dataclass
+# slots=True packs the hot scheduler fields (state, queue_level,
+# current_quantum, wait_kind) into fixed slots instead of a per-instance
+# __dict__, shrinking each Process and making attribute reads cheaper.
+@dataclass(slots=True)
 class Process:
     pid: int
     name: str
     arrival_time: int
-    actions: List[ProcessAction]
+    actions: Sequence[ProcessAction]
     memory_pages: int
-    state: str = "New"
+    state: int = STATE_NEW
     pointer: int = 0
     current_quantum: int = 0
     io_timer: int = 0
     queue_level: int = 0
-    wait_reason: str = ""
-    page_table: dict = field(default_factory=dict)
-
-    def next_action(self) -> Optional[ProcessAction]:
-        if self.pointer < len(self.actions):
-            return self.actions[self.pointer]
-        return None
+    wait_kind: int = WAIT_NONE
+    wait_resource: str = ""
+    # Indexed by page number; -1 means the page is not resident.
+    page_table: List[int] = field(default_factory=list)
 
-    def advance(self) -> None:
-        self.pointer += 1
+    def __post_init__(self) -> None:
+        if not self.page_table:
+            self.page_table = [-1] * self.memory_pages
 
     @property
     def remaining_actions(self) -> int:
-        return max(len(self.actions) - self.pointer, 0)
+        # pointer never passes len(actions); no need to clamp with max().
+        return len(self.actions) - self.pointer
+
+    def wait_label(self) -> str:
+        """Display text for the current wait condition ("" when not waiting)."""
+        if self.wait_kind == WAIT_RES:
+            return f"等待资源{self.wait_resource}"
+        return _WAIT_LABELS[self.wait_kind]
 
     def mark_blocked(self, duration: int) -> None:
-        self.state = "Blocked"
+        self.state = STATE_BLOCKED
         self.io_timer = duration
         self.current_quantum = 0
-        self.wait_reason = ""
+        self.wait_kind = WAIT_NONE
 
-    def mark_wait(self, reason: str) -> None:
-        self.state = "Blocked"
-        self.wait_reason = reason
+    def mark_wait(self, kind: int, resource: str = "") -> None:
+        self.state = STATE_BLOCKED
+        self.wait_kind = kind
+        self.wait_resource = resource
         self.current_quantum = 0
 
     def tick_block(self) -> bool:
         if self.io_timer > 0:
             self.io_timer -= 1
         if self.io_timer == 0:
-            if not self.wait_reason:
-                self.state = "Ready"
+            if not self.wait_kind:
+                self.state = STATE_READY
                 return True
         return False
 
     def ready_from_wait(self) -> None:
-        self.wait_reason = ""
-        self.state = "Ready"
+        self.wait_kind = WAIT_NONE
+        self.wait_resource = ""
+        self.state = STATE_READY
 
     def finish(self) -> None:
-        self.state = "Finished"
+        self.state = STATE_FINISHED
         self.current_quantum = 0
 
     def reset_runtime(self) -> None:
         self.current_quantum = 0
+
+    def reinit(
+        self,
+        pid: int,
+        name: str,
+        arrival_time: int,
+        memory_pages: int,
+        actions: Sequence[ProcessAction],
+    ) -> None:
+        """Reinitialize a recycled instance in place instead of allocating."""
+        self.pid = pid
+        self.name = name
+        self.arrival_time = arrival_time
+        self.actions = actions
+        self.memory_pages = memory_pages
+        self.state = STATE_NEW
+        self.pointer = 0
+        self.current_quantum = 0
+        self.io_timer = 0
+        self.queue_level = 0
+        self.wait_kind = WAIT_NONE
+        self.wait_resource = ""
+        if len(self.page_table) == memory_pages:
+            for page in range(memory_pages):
+                self.page_table[page] = -1
+        else:
+            self.page_table = [-1] * memory_pages
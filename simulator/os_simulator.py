@@ -1,19 +1,52 @@
 from __future__ import annotations
 
+import heapq
+from array import array
 from collections import deque
+from itertools import islice
 from typing import Deque, Dict, List, Optional, Tuple
 
 from .filesystem import FileSystem
 from .memory import MemoryManager
-from .models import Process, ProcessAction
+from .models import (
+    STATE_BLOCKED,
+    STATE_NEW,
+    STATE_READY,
+    STATE_RUNNING,
+    WAIT_ITEM,
+    WAIT_MUTEX,
+    WAIT_RES,
+    WAIT_SLOT,
+    Process,
+    ProcessAction,
+)
 
 
 class OSSimulator:
     """Tie together scheduling, memory, files, and process lifecycle."""
 
+    # Finished processes kept for display; older ones are recycled into the
+    # spawn pool so an endless run does not accumulate dead objects.
+    _FINISHED_KEEP = 12
+
+    # Templates for the per-tick recurring log lines; one shared string per
+    # message, rendered only when drain_log() formats the deferred entries.
+    _MSG_TICK = "===== 时钟跳动 ====="
+    _MSG_IDLE = "处理器空闲。"
+    _MSG_ACTION = "进程 %s：%s"
+    _MSG_DISPATCH = "调度进程 %s 进入CPU（队列Q%s, 时间片 %s）。"
+    _MSG_IO_DONE = "进程 %s I/O 完成，重新进入高优先级队列。"
+    _MSG_WAKE = "进程 %s 获得%s，回到高优先级队列。"
+
     def __init__(self, time_quantum: int = 2):
         self.time_quantum = time_quantum
         self.clock: int = 0
+        # Bumped on every observable state change; lets the GUI skip
+        # re-rendering snapshots it has already painted.
+        self.version: int = 0
+        # Bumped only when scheduler/memory/file state mutates, so pure
+        # idle ticks (clock + log line) can take a cheap render path.
+        self.state_version: int = 0
         self.process_pool: Dict[int, Process] = {}
         self.ready_queues: List[Deque[Process]] = [deque(), deque(), deque()]
         self.blocked: List[Process] = []
@@ -21,15 +54,68 @@ class OSSimulator:
         self.running: Optional[Process] = None
         self.memory = MemoryManager(frames=20)
         self.file_system = FileSystem()
-        self.event_log: List[str] = []
+        # Deferred log entries (clock, fmt, args); formatting happens in
+        # drain_log() so suppressed or scrolled-off lines cost no string
+        # work, and maxlen bounds long-run memory.
+        self.event_log: Deque[Tuple[int, str, tuple]] = deque(maxlen=2048)
+        self._log_cursor = 0
+        self._log_seq = 0
         self.buffer_capacity = 5
-        self.buffer_slots: List[Optional[int]] = [None] * self.buffer_capacity
+        # Packed C ints, -1 meaning "slot empty"; avoids boxing a PyObject
+        # pointer per slot on the producer/consumer hot path.
+        self.buffer_slots = array("i", [-1] * self.buffer_capacity)
         self.buffer_in = 0
         self.buffer_out = 0
         self.buffer_count = 0
         self.mutex_owner: Optional[int] = None
         self.shared_resources: Dict[str, int] = {"磁带机": 1, "GPU": 1, "打印机": 2}
         self.queue_quantums = [1, 2, 4]
+        # Pending "New" processes keyed by (arrival_time, pid); step() only
+        # pops the ones whose arrival time has come instead of scanning the
+        # whole process pool every tick.
+        self._arrivals: List[Tuple[int, int]] = []
+        # Bit i is set while ready_queues[i] is non-empty; dispatch picks
+        # the lowest set bit instead of probing each deque.
+        self._nonempty_mask = 0
+        # Per-condition wait queues: producers waiting for a free slot and
+        # consumers waiting for a product wake directly from the event that
+        # satisfies them instead of being re-polled every tick.
+        self._wait_empty_slot: Deque[Process] = deque()
+        self._wait_item: Deque[Process] = deque()
+        # FIFO of processes blocked on the buffer mutex; release hands
+        # ownership straight to the head instead of polling for it.
+        self._mutex_waiters: Deque[Process] = deque()
+        # Waiters keyed by shared-resource name; a release wakes the head
+        # directly instead of the blocked scan re-checking availability.
+        self._res_waiters: Dict[str, Deque[Process]] = {}
+        self._proc_free: List[Process] = []
+        # Clock value of the next dynamic spawn; compared instead of running
+        # clock % spawn_interval every tick, and the cadence stays tunable.
+        self.spawn_interval = 4
+        self._next_spawn = self.spawn_interval
+        # Reused snapshot buffer; snapshot() refills the nested lists in
+        # place so steady polling does not rebuild the dict tree every tick.
+        self._snap: Dict[str, object] = {
+            "blocked": [],
+            "finished": [],
+            "buffer": {"slots": []},
+            "log": [],
+        }
+        # Action dispatch table; handlers return True when the process left
+        # the CPU and _run_action must stop instead of advancing it.
+        self._action_dispatch = {
+            "cpu": self._exec_cpu,
+            "io": self._exec_io,
+            "mem": self._exec_mem,
+            "produce": self._exec_pc,
+            "consume": self._exec_pc,
+            "file_create": self._exec_file,
+            "file_write": self._exec_file,
+            "file_read": self._exec_file,
+            "file_delete": self._exec_file,
+            "res_acquire": self._exec_resource,
+            "res_release": self._exec_resource,
+        }
         self.templates = self._default_templates()
         self.dynamic_templates = self._dynamic_templates()
         self.next_pid = len(self.templates) + 1
@@ -42,7 +128,7 @@ class OSSimulator:
                 name="生产者A",
                 arrival_time=0,
                 memory_pages=3,
-                actions=[
+                actions=(
                     ProcessAction("produce", "申请互斥并生产一件产品"),
                     ProcessAction("mem", "访问代码页", page=0),
                     ProcessAction("produce", "继续生产填充缓冲区"),
@@ -50,42 +136,42 @@ class OSSimulator:
                     ProcessAction("cpu", "计算校验码"),
                     ProcessAction("produce", "尝试再放入一件"),
                     ProcessAction("produce", "再次填充，可能触发满等待"),
-                ],
+                ),
             ),
             Process(
                 pid=2,
                 name="消费者B",
                 arrival_time=0,
                 memory_pages=3,
-                actions=[
+                actions=(
                     ProcessAction("consume", "申请互斥并消费一件产品"),
                     ProcessAction("mem", "访问数据页", page=1),
                     ProcessAction("consume", "继续消费"),
                     ProcessAction("io", "输出结果", io_duration=1),
                     ProcessAction("consume", "再次消费"),
                     ProcessAction("consume", "直到缓冲区空，可能阻塞"),
-                ],
+                ),
             ),
             Process(
                 pid=3,
                 name="生产者C",
                 arrival_time=1,
                 memory_pages=3,
-                actions=[
+                actions=(
                     ProcessAction("produce", "批量生产，补充库存"),
                     ProcessAction("produce", "继续生产"),
                     ProcessAction("mem", "更新生产统计", page=1),
                     ProcessAction("produce", "再放入一件"),
                     ProcessAction("cpu", "计算下一批计划"),
                     ProcessAction("produce", "补齐缓冲，可能等待空位"),
-                ],
+                ),
             ),
             Process(
                 pid=4,
                 name="备份程序",
                 arrival_time=3,
                 memory_pages=4,
-                actions=[
+                actions=(
                     ProcessAction("file_create", "创建日志", path="/backup/log", size=1),
                     ProcessAction("mem", "扫描页", page=0),
                     ProcessAction("cpu", "压缩数据"),
@@ -96,26 +182,26 @@ class OSSimulator:
                     ProcessAction("res_acquire", "占用磁带机写出", resource="磁带机"),
                     ProcessAction("cpu", "收尾"),
                     ProcessAction("res_release", "释放磁带机", resource="磁带机"),
-                ],
+                ),
             ),
             Process(
                 pid=5,
                 name="消费者D",
                 arrival_time=2,
                 memory_pages=2,
-                actions=[
+                actions=(
                     ProcessAction("consume", "尝试消费产品，可能等待"),
                     ProcessAction("mem", "访问缓存页", page=1),
                     ProcessAction("consume", "继续消费清空缓冲"),
                     ProcessAction("consume", "再次消费"),
-                ],
+                ),
             ),
             Process(
                 pid=6,
                 name="数据库",
                 arrival_time=2,
                 memory_pages=5,
-                actions=[
+                actions=(
                     ProcessAction("cpu", "接收查询"),
                     ProcessAction("mem", "访问索引页", page=2),
                     ProcessAction("file_read", "读取数据页", path="/data/users", size=2),
@@ -125,150 +211,210 @@ class OSSimulator:
                     ProcessAction("mem", "访问缓存页", page=3),
                     ProcessAction("res_release", "释放GPU", resource="GPU"),
                     ProcessAction("cpu", "返回结果"),
-                ],
+                ),
             ),
         ]
 
-    def _dynamic_templates(self) -> List[List[ProcessAction]]:
+    def _dynamic_templates(self) -> List[Tuple[ProcessAction, ...]]:
         return [
-            [
+            (
                 ProcessAction("cpu", "短作业计算"),
                 ProcessAction("mem", "访存页", page=0),
                 ProcessAction("cpu", "快速结束"),
-            ],
-            [
+            ),
+            (
                 ProcessAction("res_acquire", "申请打印机生成报表", resource="打印机"),
                 ProcessAction("cpu", "格式化报表"),
                 ProcessAction("mem", "加载模板页", page=2),
                 ProcessAction("res_release", "释放打印机", resource="打印机"),
-            ],
-            [
+            ),
+            (
                 ProcessAction("mem", "预取代码页", page=1),
                 ProcessAction("io", "等待网络", io_duration=1),
                 ProcessAction("file_read", "读取配置", path="/etc/conf", size=1),
                 ProcessAction("cpu", "处理请求"),
-            ],
+            ),
         ]
 
     def reset(self) -> None:
         self.clock = 0
+        self.version += 1
+        self.state_version += 1
         self.process_pool = {proc.pid: self._clone_process(proc) for proc in self.templates}
+        self._arrivals = [(proc.arrival_time, proc.pid) for proc in self.process_pool.values()]
+        heapq.heapify(self._arrivals)
         for q in self.ready_queues:
             q.clear()
+        self._nonempty_mask = 0
         self.blocked.clear()
+        self._wait_empty_slot.clear()
+        self._wait_item.clear()
+        self._mutex_waiters.clear()
+        self._res_waiters.clear()
+        self._proc_free.clear()
         self.finished.clear()
         self.running = None
         self.memory.reset()
         self.file_system.reset()
         self.event_log.clear()
-        self.buffer_slots = [None] * self.buffer_capacity
+        self._log_cursor = 0
+        self._log_seq = 0
+        self.buffer_slots = array("i", [-1] * self.buffer_capacity)
         self.buffer_in = 0
         self.buffer_out = 0
         self.buffer_count = 0
         self.mutex_owner = None
+        self._next_spawn = self.spawn_interval
         self.next_pid = len(self.templates) + 1
 
     def _clone_process(self, template: Process) -> Process:
+        # Action scripts are immutable tuples, so clones share them instead
+        # of copying the list on every reset.
         return Process(
             pid=template.pid,
             name=template.name,
             arrival_time=template.arrival_time,
-            actions=list(template.actions),
+            actions=template.actions,
             memory_pages=template.memory_pages,
         )
 
-    def _log(self, message: str) -> None:
-        self.event_log.append(f"[t={self.clock}] {message}")
+    def _log(self, fmt: str, *args: object) -> None:
+        self.version += 1
+        self._log_seq += 1
+        self.event_log.append((self.clock, fmt, args))
+
+    def drain_log(self) -> List[str]:
+        """Format and return the log lines appended since the previous drain."""
+        # The deque drops its oldest entries on overflow, so translate the
+        # global cursor into an index relative to what is still retained.
+        start = self._log_cursor - (self._log_seq - len(self.event_log))
+        if start < 0:
+            start = 0
+        new = [
+            f"[t={clock}] {fmt % args if args else fmt}"
+            for clock, fmt, args in islice(self.event_log, start, None)
+        ]
+        self._log_cursor = self._log_seq
+        return new
 
     def _spawn_dynamic_job(self) -> None:
         index = (self.clock // 3) % len(self.dynamic_templates)
-        actions = [
-            ProcessAction(a.kind, a.description, a.page, a.path, a.size, a.io_duration, a.resource)
-            for a in self.dynamic_templates[index]
-        ]
-        proc = Process(
-            pid=self.next_pid,
-            name=f"新作业{self.next_pid}",
-            arrival_time=self.clock,
-            memory_pages=3,
-            actions=actions,
-        )
+        if self._proc_free:
+            proc = self._proc_free.pop()
+            proc.reinit(
+                pid=self.next_pid,
+                name=f"新作业{self.next_pid}",
+                arrival_time=self.clock,
+                memory_pages=3,
+                actions=self.dynamic_templates[index],
+            )
+        else:
+            proc = Process(
+                pid=self.next_pid,
+                name=f"新作业{self.next_pid}",
+                arrival_time=self.clock,
+                memory_pages=3,
+                # Frozen actions are shared with the template; the process
+                # only tracks its own pointer into the script.
+                actions=self.dynamic_templates[index],
+            )
         self.process_pool[proc.pid] = proc
         self.next_pid += 1
-        proc.state = "Ready"
+        self.state_version += 1
+        proc.state = STATE_READY
         proc.queue_level = 0
-        self.ready_queues[0].append(proc)
-        self._log(f"自动生成新进程 {proc.pid} 插入就绪队列，保持持续负载。")
+        self._enqueue(0, proc)
+        self._log("自动生成新进程 %s 插入就绪队列，保持持续负载。", proc.pid)
+
+    def _enqueue(self, level: int, proc: Process) -> None:
+        self.ready_queues[level].append(proc)
+        self._nonempty_mask |= 1 << level
 
     def _dispatch_if_needed(self) -> None:
-        if self.running is None:
-            for level, queue in enumerate(self.ready_queues):
-                if queue:
-                    self.running = queue.popleft()
-                    self.running.state = "Running"
-                    self.running.reset_runtime()
-                    self.running.queue_level = level
-                    self._log(
-                        f"调度进程 {self.running.pid} 进入CPU（队列Q{level}, 时间片 {self.queue_quantums[level]}）。"
-                    )
-                    break
+        mask = self._nonempty_mask
+        if self.running is not None or not mask:
+            return
+        # Lowest set bit is the highest-priority non-empty queue.
+        level = (mask & -mask).bit_length() - 1
+        queue = self.ready_queues[level]
+        proc = queue.popleft()
+        if not queue:
+            self._nonempty_mask = mask & ~(1 << level)
+        self.state_version += 1
+        self.running = proc
+        proc.state = STATE_RUNNING
+        proc.reset_runtime()
+        proc.queue_level = level
+        self._log(self._MSG_DISPATCH, proc.pid, level, self.queue_quantums[level])
 
     def _handle_blocked(self) -> None:
-        newly_ready: List[Tuple[Process, str]] = []
-        for proc in list(self.blocked):
-            if proc.wait_reason:
-                if self._can_wake_from_wait(proc):
-                    reason = proc.wait_reason
-                    proc.ready_from_wait()
-                    newly_ready.append((proc, reason))
-            elif proc.tick_block():
-                newly_ready.append((proc, ""))
-        self.blocked = [p for p in self.blocked if p.state == "Blocked"]
-        for proc, reason in newly_ready:
+        if not self.blocked:
+            return
+        self.state_version += 1
+        # Every wait condition wakes from its own queue now, so this pass
+        # only counts down timed I/O blocks. One pass with a write cursor:
+        # survivors are compacted in place without allocating a new list.
+        newly_ready: List[Process] = []
+        write = 0
+        for proc in self.blocked:
+            if not proc.wait_kind and proc.tick_block():
+                newly_ready.append(proc)
+                continue
+            self.blocked[write] = proc
+            write += 1
+        del self.blocked[write:]
+        for proc in newly_ready:
             proc.queue_level = 0
-            self.ready_queues[proc.queue_level].append(proc)
-            if reason:
-                self._log(f"进程 {proc.pid} 获得{reason}，回到高优先级队列。")
-            else:
-                self._log(f"进程 {proc.pid} I/O 完成，重新进入高优先级队列。")
+            self._enqueue(0, proc)
+            self._log(self._MSG_IO_DONE, proc.pid)
 
     def _complete_process(self, proc: Process) -> None:
         proc.finish()
         self.finished.append(proc)
-        self._log(f"进程 {proc.pid} 已完成全部动作。")
+        if len(self.finished) > self._FINISHED_KEEP:
+            retired = self.finished.pop(0)
+            self.process_pool.pop(retired.pid, None)
+            self._proc_free.append(retired)
+        self._log("进程 %s 已完成全部动作。", proc.pid)
         self.running = None
 
     def _preempt(self, proc: Process) -> None:
-        proc.state = "Ready"
+        proc.state = STATE_READY
         proc.current_quantum = 0
         proc.queue_level = min(proc.queue_level + 1, len(self.ready_queues) - 1)
-        self.ready_queues[proc.queue_level].append(proc)
-        self._log(f"进程 {proc.pid} 时间片用完，降到队列 Q{proc.queue_level}。")
+        self._enqueue(proc.queue_level, proc)
+        self._log("进程 %s 时间片用完，降到队列 Q%s。", proc.pid, proc.queue_level)
         self.running = None
 
     def _block(self, proc: Process, duration: int) -> None:
         proc.mark_blocked(duration)
         self.blocked.append(proc)
-        self._log(f"进程 {proc.pid} 阻塞，等待 {duration} 个时间片。")
+        self._log("进程 %s 阻塞，等待 %s 个时间片。", proc.pid, duration)
         self.running = None
 
-    def _block_reason(self, proc: Process, reason: str) -> None:
-        proc.mark_wait(reason)
+    def _block_reason(self, proc: Process, kind: int, resource: str = "") -> None:
+        proc.mark_wait(kind, resource)
         self.blocked.append(proc)
-        self._log(f"进程 {proc.pid} 因 {reason} 阻塞，等待资源。")
+        if kind == WAIT_SLOT:
+            self._wait_empty_slot.append(proc)
+        elif kind == WAIT_ITEM:
+            self._wait_item.append(proc)
+        elif kind == WAIT_MUTEX:
+            self._mutex_waiters.append(proc)
+        elif kind == WAIT_RES:
+            self._res_waiters.setdefault(resource, deque()).append(proc)
+        self._log("进程 %s 因 %s 阻塞，等待资源。", proc.pid, proc.wait_label())
         self.running = None
 
-    def _can_wake_from_wait(self, proc: Process) -> bool:
-        if proc.wait_reason == "等待空槽":
-            return self.buffer_count < self.buffer_capacity
-        if proc.wait_reason == "等待产品":
-            return self.buffer_count > 0
-        if proc.wait_reason == "等待互斥锁":
-            return self.mutex_owner is None
-        if proc.wait_reason.startswith("等待资源"):
-            resource = proc.wait_reason.replace("等待资源", "")
-            return self.shared_resources.get(resource, 0) > 0
-        return False
+    def _wake_waiter(self, waiters: Deque[Process]) -> None:
+        proc = waiters.popleft()
+        self.blocked.remove(proc)
+        reason = proc.wait_label()
+        proc.ready_from_wait()
+        proc.queue_level = 0
+        self._enqueue(0, proc)
+        self.state_version += 1
+        self._log(self._MSG_WAKE, proc.pid, reason)
 
     def _execute_memory(self, proc: Process, action: ProcessAction) -> None:
         fault, frame, evicted = self.memory.access_page(proc, action.page or 0)
@@ -276,14 +422,18 @@ class OSSimulator:
             if evicted:
                 evicted_pid, evicted_page = evicted
                 owner = self.process_pool.get(evicted_pid)
-                if owner:
-                    owner.page_table.pop(evicted_page, None)
+                if owner and evicted_page < len(owner.page_table):
+                    owner.page_table[evicted_page] = -1
             evicted_text = f"，淘汰页 {evicted}" if evicted else ""
             self._log(
-                f"进程 {proc.pid} 访问虚页 {action.page} 发生缺页，装入帧 {frame}{evicted_text}。"
+                "进程 %s 访问虚页 %s 发生缺页，装入帧 %s%s。",
+                proc.pid,
+                action.page,
+                frame,
+                evicted_text,
             )
         else:
-            self._log(f"进程 {proc.pid} 命中物理帧 {frame}。")
+            self._log("进程 %s 命中物理帧 %s。", proc.pid, frame)
 
     def _with_mutex(self, proc: Process) -> bool:
         if self.mutex_owner is None:
@@ -291,11 +441,19 @@ class OSSimulator:
             return True
         if self.mutex_owner == proc.pid:
             return True
-        self._block_reason(proc, "等待互斥锁")
+        self._block_reason(proc, WAIT_MUTEX)
         return False
 
     def _release_mutex(self, proc: Process) -> None:
-        if self.mutex_owner == proc.pid:
+        if self.mutex_owner != proc.pid:
+            return
+        if self._mutex_waiters:
+            # Hand the lock straight to the first waiter so it wakes with
+            # ownership already granted.
+            new_owner = self._mutex_waiters[0]
+            self._wake_waiter(self._mutex_waiters)
+            self.mutex_owner = new_owner.pid
+        else:
             self.mutex_owner = None
 
     def _execute_pc_action(self, proc: Process, action: ProcessAction) -> None:
@@ -304,42 +462,71 @@ class OSSimulator:
         if action.kind == "produce":
             if self.buffer_count >= self.buffer_capacity:
                 self._release_mutex(proc)
-                self._block_reason(proc, "等待空槽")
+                self._block_reason(proc, WAIT_SLOT)
                 return
-            self.buffer_slots[self.buffer_in] = proc.pid
             slot = self.buffer_in
-            self.buffer_in = (self.buffer_in + 1) % self.buffer_capacity
+            self.buffer_slots[slot] = proc.pid
+            # Wrap with a compare instead of %: the cursor only ever steps
+            # by one, and the capacity is not a power of two.
+            self.buffer_in = slot + 1
+            if self.buffer_in == self.buffer_capacity:
+                self.buffer_in = 0
             self.buffer_count += 1
             self._log(
-                f"进程 {proc.pid} 生产 1 件产品放入槽位 {slot}，缓冲区 {self.buffer_count}/{self.buffer_capacity}。",
+                "进程 %s 生产 1 件产品放入槽位 %s，缓冲区 %s/%s。",
+                proc.pid,
+                slot,
+                self.buffer_count,
+                self.buffer_capacity,
             )
+            if self._wait_item:
+                self._wake_waiter(self._wait_item)
         elif action.kind == "consume":
             if self.buffer_count <= 0:
                 self._release_mutex(proc)
-                self._block_reason(proc, "等待产品")
+                self._block_reason(proc, WAIT_ITEM)
                 return
-            owner = self.buffer_slots[self.buffer_out]
             slot = self.buffer_out
-            self.buffer_slots[self.buffer_out] = None
-            self.buffer_out = (self.buffer_out + 1) % self.buffer_capacity
+            owner = self.buffer_slots[slot]
+            self.buffer_slots[slot] = -1
+            self.buffer_out = slot + 1
+            if self.buffer_out == self.buffer_capacity:
+                self.buffer_out = 0
             self.buffer_count -= 1
-            who = f"(来自P{owner})" if owner is not None else ""
+            who = f"(来自P{owner})" if owner >= 0 else ""
             self._log(
-                f"进程 {proc.pid} 消费槽位 {slot} 的产品{who}，缓冲区 {self.buffer_count}/{self.buffer_capacity}。",
+                "进程 %s 消费槽位 %s 的产品%s，缓冲区 %s/%s。",
+                proc.pid,
+                slot,
+                who,
+                self.buffer_count,
+                self.buffer_capacity,
             )
+            if self._wait_empty_slot:
+                self._wake_waiter(self._wait_empty_slot)
         self._release_mutex(proc)
 
     def _execute_resource_action(self, proc: Process, action: ProcessAction) -> None:
         resource = action.resource or "未知资源"
+        # One dict probe per operation: read the count into a local, adjust,
+        # write it back, and log from the local.
+        available = self.shared_resources.get(resource, 0)
         if action.kind == "res_acquire":
-            if self.shared_resources.get(resource, 0) <= 0:
-                self._block_reason(proc, f"等待资源{resource}")
+            if available <= 0:
+                self._block_reason(proc, WAIT_RES, resource)
                 return
-            self.shared_resources[resource] -= 1
-            self._log(f"进程 {proc.pid} 获取资源 {resource}，剩余 {self.shared_resources[resource]}。")
+            available -= 1
+            self.shared_resources[resource] = available
+            self._log("进程 %s 获取资源 %s，剩余 %s。", proc.pid, resource, available)
         else:
-            self.shared_resources[resource] = self.shared_resources.get(resource, 0) + 1
-            self._log(f"进程 {proc.pid} 释放资源 {resource}，可用 {self.shared_resources[resource]}。")
+            available += 1
+            self.shared_resources[resource] = available
+            self._log("进程 %s 释放资源 %s，可用 %s。", proc.pid, resource, available)
+            waiters = self._res_waiters.get(resource)
+            if waiters:
+                # The woken process re-runs its res_acquire when dispatched,
+                # so the count is not decremented here.
+                self._wake_waiter(waiters)
 
     def _execute_file_action(self, proc: Process, action: ProcessAction) -> None:
         if action.kind == "file_create":
@@ -354,36 +541,52 @@ class OSSimulator:
             message = "未知文件操作"
         self._log(message)
 
+    def _exec_cpu(self, proc: Process, action: ProcessAction) -> bool:
+        return False
+
+    def _exec_io(self, proc: Process, action: ProcessAction) -> bool:
+        proc.pointer += 1
+        self._block(proc, action.io_duration or 1)
+        return True
+
+    def _exec_mem(self, proc: Process, action: ProcessAction) -> bool:
+        self._execute_memory(proc, action)
+        return False
+
+    def _exec_pc(self, proc: Process, action: ProcessAction) -> bool:
+        self._execute_pc_action(proc, action)
+        return proc.state == STATE_BLOCKED
+
+    def _exec_file(self, proc: Process, action: ProcessAction) -> bool:
+        self._execute_file_action(proc, action)
+        return False
+
+    def _exec_resource(self, proc: Process, action: ProcessAction) -> bool:
+        self._execute_resource_action(proc, action)
+        return proc.state == STATE_BLOCKED
+
     def _run_action(self, proc: Process) -> None:
-        action = proc.next_action()
-        if action is None:
+        self.state_version += 1
+        # Inline program counter: index the shared action tuple directly
+        # instead of going through next_action()/advance() method calls.
+        actions = proc.actions
+        pointer = proc.pointer
+        if pointer >= len(actions):
             self._complete_process(proc)
             return
-
-        self._log(f"进程 {proc.pid}：{action.description}")
-        if action.kind == "cpu":
-            pass
-        elif action.kind == "io":
-            proc.advance()
-            self._block(proc, action.io_duration or 1)
+        action = actions[pointer]
+
+        self._log(self._MSG_ACTION, proc.pid, action.description)
+        handler = self._action_dispatch.get(action.kind)
+        if handler is None:
+            self._log("进程 %s 执行未知操作 %s", proc.pid, action.kind)
+        elif handler(proc, action):
+            # The handler took the process off the CPU (blocked on I/O,
+            # a full/empty buffer, or an unavailable resource).
             return
-        elif action.kind == "mem":
-            self._execute_memory(proc, action)
-        elif action.kind in {"produce", "consume"}:
-            self._execute_pc_action(proc, action)
-            if proc.state == "Blocked":
-                return
-        elif action.kind.startswith("file"):
-            self._execute_file_action(proc, action)
-        elif action.kind.startswith("res_"):
-            self._execute_resource_action(proc, action)
-            if proc.state == "Blocked":
-                return
-        else:
-            self._log(f"进程 {proc.pid} 执行未知操作 {action.kind}")
 
-        proc.advance()
-        if proc.remaining_actions == 0:
+        proc.pointer = pointer + 1
+        if proc.pointer >= len(actions):
             self._complete_process(proc)
             return
 
@@ -393,46 +596,64 @@ class OSSimulator:
 
     def step(self) -> None:
         self.clock += 1
-        self._log("===== 时钟跳动 =====")
-
-        for proc in list(self.process_pool.values()):
-            if proc.state == "New" and proc.arrival_time <= self.clock:
-                proc.state = "Ready"
-                proc.queue_level = 0
-                self.ready_queues[0].append(proc)
-                self._log(f"新进程 {proc.pid} ({proc.name}) 到达并进入就绪队列 Q0。")
+        self._log(self._MSG_TICK)
+
+        while self._arrivals and self._arrivals[0][0] <= self.clock:
+            _, pid = heapq.heappop(self._arrivals)
+            proc = self.process_pool[pid]
+            if proc.state != STATE_NEW:
+                continue
+            self.state_version += 1
+            proc.state = STATE_READY
+            proc.queue_level = 0
+            self._enqueue(0, proc)
+            self._log("新进程 %s (%s) 到达并进入就绪队列 Q0。", proc.pid, proc.name)
 
         self._handle_blocked()
         self._dispatch_if_needed()
         if self.running:
             self._run_action(self.running)
         else:
-            self._log("处理器空闲。")
+            self._log(self._MSG_IDLE)
 
-        if self.clock % 4 == 0:
+        if self.clock >= self._next_spawn:
             self._spawn_dynamic_job()
+            self._next_spawn = self.clock + self.spawn_interval
 
     def snapshot(self) -> Dict[str, object]:
-        return {
-            "clock": self.clock,
-            "running": self.running,
-            "ready": [list(q) for q in self.ready_queues],
-            "blocked": list(self.blocked),
-            "finished": list(self.finished),
-            "frames": self.memory.frame_table,
-            "last_access": self.memory.last_access,
-            "page_tables": {pid: proc.page_table for pid, proc in self.process_pool.items()},
-            "process_meta": {
-                pid: {"name": proc.name, "memory_pages": proc.memory_pages}
-                for pid, proc in self.process_pool.items()
-            },
-            "files": self.file_system.files,
-            "buffer": {
-                "used": self.buffer_count,
-                "capacity": self.buffer_capacity,
-                "slots": list(self.buffer_slots),
-                "in": self.buffer_in,
-                "out": self.buffer_out,
-            },
-            "log": list(self.event_log),
+        snap = self._snap
+        # version moves on every observable change (every mutator logs), so
+        # an unchanged version means the cached buffer is still accurate.
+        if snap.get("version") == self.version:
+            return snap
+        snap["version"] = self.version
+        snap["state_version"] = self.state_version
+        snap["clock"] = self.clock
+        snap["running"] = self.running
+        # Shared by reference: the GUI only iterates the queues, so there is
+        # no need to copy three deques into lists every tick.
+        snap["ready"] = self.ready_queues
+        snap["blocked"][:] = self.blocked
+        snap["finished"][:] = self.finished
+        snap["frames"] = self.memory.frame_table
+        snap["last_access"] = self.memory.last_access
+        snap["process_meta"] = {
+            pid: {"name": proc.name, "memory_pages": proc.memory_pages}
+            for pid, proc in self.process_pool.items()
         }
+        snap["files"] = self.file_system.files
+        snap["files_version"] = self.file_system.version
+        buffer = snap["buffer"]
+        buffer["used"] = self.buffer_count
+        buffer["capacity"] = self.buffer_capacity
+        # Translate the -1 sentinel back to None for external consumers.
+        buffer["slots"][:] = [owner if owner >= 0 else None for owner in self.buffer_slots]
+        buffer["in"] = self.buffer_in
+        buffer["out"] = self.buffer_out
+        # The log is stored as deferred (clock, fmt, args) entries; render
+        # them here so snapshot consumers keep getting formatted strings.
+        snap["log"][:] = [
+            f"[t={clock}] {fmt % args if args else fmt}"
+            for clock, fmt, args in self.event_log
+        ]
+        return snap